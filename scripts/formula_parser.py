@@ -5,6 +5,7 @@ Formula parser module for Google Sheets formulas.
 This module provides:
 - FormulaParser: A pyparsing-based parser for Google Sheets formula syntax
 - strip_comments: Utility function to remove comments from formulas
+- STRING_LITERAL: Tag identifying quoted string literals in the parsed AST
 
 The parser supports:
 - Function calls with arguments (including nested and zero-argument calls)
@@ -17,7 +18,9 @@ The parser supports:
 """
 
 import re
-from typing import Any, Dict, List, Set
+from functools import cached_property, lru_cache
+from operator import itemgetter
+from typing import AbstractSet, Any, Dict, List, Tuple
 
 from pyparsing import (
     DelimitedList,
@@ -25,15 +28,34 @@ from pyparsing import (
     Group,
     Literal,
     Optional,
+    ParseException,
     ParseResults,
-    Word,
+    Regex,
     ZeroOrMore,
-    alphanums,
-    alphas,
-    pyparsing_common,
 )
 
 
+# Tag marking quoted string literals in the AST: (STRING_LITERAL, "text").
+# Compare tags with ==, since ASTs rebuilt from pickle or JSON carry equal
+# but distinct strings.
+STRING_LITERAL = "__STRING_LITERAL__"
+
+# Separator placed between non-empty arguments when reconstructing a call
+_ARG_SEPARATOR = ", "
+
+# Number of ASTs FormulaParser keeps per-AST cache entries for
+_AST_CACHE_SIZE = 256
+
+# First characters of a numeric atom (see FormulaParser grammar)
+_NUMBER_START = frozenset("+-.0123456789")
+
+# Number of distinct normalized formulas FormulaParser.parse memoizes
+_PARSE_CACHE_SIZE = 1024
+
+# Characters that can start a comment or a string literal
+_COMMENT_OR_QUOTE = re.compile(r"[/\"']")
+
+
 def strip_comments(formula: str) -> str:
     """
     Remove // and /* */ style comments from formula text.
@@ -46,66 +68,167 @@ def strip_comments(formula: str) -> str:
 
     Returns:
         Formula with comments removed
+
+    Comment markers inside string literals are left untouched. An unclosed
+    block comment is kept as-is, matching what Google Sheets would reject.
     """
-    # Remove /* */ style block comments
-    result = re.sub(r"/\*.*?\*/", "", formula, flags=re.DOTALL)
-    # Remove // style line comments
-    result = re.sub(r"//[^\n]*", "", result)
-    return result
+    # Most formulas have no comments; without a marker the scan would copy the input
+    if "//" not in formula and "/*" not in formula:
+        return formula
+
+    parts = []
+    pos = 0
+    length = len(formula)
+    while True:
+        match = _COMMENT_OR_QUOTE.search(formula, pos)
+        if match is None:
+            parts.append(formula[pos:])
+            break
+        start = match.start()
+        char = formula[start]
+        if char == "/":
+            following = formula[start + 1 : start + 2]
+            end = -1
+            if following == "/":
+                # Line comment: drop everything up to (not including) the newline
+                end = formula.find("\n", start)
+                if end == -1:
+                    end = length
+            elif following == "*":
+                # Block comment: drop everything through the closing */
+                end = formula.find("*/", start + 2)
+                if end != -1:
+                    end += 2
+            if end == -1:
+                parts.append(formula[pos : start + 1])
+                pos = start + 1
+            else:
+                parts.append(formula[pos:start])
+                pos = end
+        else:
+            # String literal: copy through the closing quote. Doubled quotes
+            # ("") close and immediately reopen, which yields the same text.
+            end = formula.find(char, start + 1)
+            if end == -1:
+                parts.append(formula[pos:])
+                break
+            parts.append(formula[pos : end + 1])
+            pos = end + 1
+    return "".join(parts)
+
+
+def _cache_get(cache: Dict[int, Tuple[Any, Any]], ast: Any) -> Any:
+    """Return the value cached for this exact AST object, or None."""
+    entry = cache.get(id(ast))
+    if entry is not None and entry[0] is ast:
+        return entry[1]
+    return None
+
+
+def _cache_put(cache: Dict[int, Tuple[Any, Any]], ast: Any, value: Any) -> None:
+    """Cache a value for an AST, evicting the oldest entry when the cache is full."""
+    if len(cache) >= _AST_CACHE_SIZE:
+        # Dicts preserve insertion order, so the first key is the oldest
+        del cache[next(iter(cache))]
+    cache[id(ast)] = (ast, value)
 
 
 class FormulaParser:
     """Parser for Google Sheets formulas using pyparsing."""
 
     def __init__(self):
-        """Initialize the parser with grammar definition."""
+        """Initialize the parser; the grammar is built on first use."""
+        # Per-AST caches keyed by id(ast): the source text each AST was parsed
+        # from, and the unfiltered calls found in it. The AST itself is kept in
+        # each entry so its id cannot be reused while the entry is cached.
+        self._source_cache: Dict[int, Tuple[ParseResults, str]] = {}
+        self._calls_cache: Dict[int, Tuple[ParseResults, List[Dict[str, Any]]]] = {}
+
+        # Memoized parse keyed by normalized text. Callers share the returned
+        # ParseResults, so they must treat ASTs as read-only.
+        self._parse_normalized = lru_cache(maxsize=_PARSE_CACHE_SIZE)(self._parse_uncached)
+
+    @cached_property
+    def grammar(self) -> Forward:
+        """The pyparsing grammar, built once per parser on first access."""
         # Define basic tokens
-        identifier = Word(alphas + "_", alphanums + "_")
         lparen = Literal("(")
         rparen = Literal(")")
         comma = Literal(",")
 
+        # Single-token terms are matched by one combined Regex (see atom below).
+        # Each pattern keeps the behavior of the pyparsing element it replaced.
+
         # String literals (handle escaped quotes)
         # Google Sheets uses doubled-quote escaping: "" within a string represents a single "
         # Note: pyparsing's esc_quote parameter has a bug when """ is followed by , and then "
         # So we use a custom regex-based parser instead
-        from pyparsing import Regex
 
         # Match double-quoted strings: opening ", content (with "" escapes), closing "
         # The content can be: any char except ", OR "" (escaped quote)
         # Pattern: " (?: [^"] | "" )* "
-        double_quoted = Regex(r'"(?:[^"]|"")*"')
+        double_quoted = r'"(?:[^"]|"")*"'
 
         # Match single-quoted strings: opening ', content (with '' escapes), closing '
         # Pattern: ' (?: [^'] | '' )* '
-        single_quoted = Regex(r"'(?:[^']|'')*'")
-
-        def process_string_literal(t):
-            """Process a quoted string literal, unescaping doubled quotes."""
-            s = t[0]
-            # Remove opening and closing quotes
-            content = s[1:-1]
-            # Unescape doubled quotes
-            if s[0] == '"':
-                content = content.replace('""', '"')
-            else:  # single quote
-                content = content.replace("''", "'")
-            return ("__STRING_LITERAL__", content)
+        single_quoted = r"'(?:[^']|'')*'"
 
-        string_literal = (double_quoted | single_quoted).set_parse_action(process_string_literal)
+        # Array literal: {1,2,3} or {1,2;3,4}
+        # Arrays can contain expressions separated by commas (columns) and semicolons (rows)
+        # Use regex to match content inside braces, requiring at least one non-delimiter element
+        # This rejects empty arrays {} and delimiter-only arrays {,} {;} which Google Sheets rejects
+        array_literal = r"\{[^}]*[^,;\s}][^}]*\}"
 
-        # Numbers
-        number = pyparsing_common.number()
+        # Range reference: A1:B10, A:A, 1:1, etc.
+        # Use Regex for flexibility with sheet references and complex patterns
+        range_ref = r"[A-Za-z$]*[0-9$]*:[A-Za-z$]*[0-9$]*"
+
+        # Numbers: the alternatives of pyparsing_common.number, in its order
+        # (scientific real, real, signed integer)
+        number = (
+            r"[+-]?(?:\d+(?:[eE][+-]?\d+)|(?:\d+\.\d*|\.\d+)(?:[eE][+-]?\d+)?)"
+            r"|[+-]?(?:\d+\.\d*|\.\d+)"
+            r"|[+-]?\d+"
+        )
 
         # Cell reference patterns: A1, $A$1, etc.
         # Include underscore to prevent partial matching of identifiers like header_rows
-        cell_ref = Word(alphas + "$", alphanums + "$" + "_")
+        cell_ref = r"[A-Za-z$][A-Za-z0-9$_]*"
 
-        # Range reference: A1:B10, A:A, 1:1, etc.
-        # Use Regex for flexibility with sheet references and complex patterns
-        from pyparsing import Regex
+        # Identifiers (cell_ref covers all but those starting with an underscore)
+        bare_identifier = r"[A-Za-z_][A-Za-z0-9_]*"
 
-        range_ref = Regex(r"[A-Za-z$]*[0-9$]*:[A-Za-z$]*[0-9$]*")
+        def process_atom(t):
+            """Convert string literals and numbers; other atoms stay as text."""
+            s = t[0]
+            first = s[0]
+            if first == '"':
+                # Remove the quotes and unescape doubled quotes
+                return (STRING_LITERAL, s[1:-1].replace('""', '"'))
+            if first == "'":
+                return (STRING_LITERAL, s[1:-1].replace("''", "'"))
+            if first == "{" or ":" in s or first not in _NUMBER_START:
+                return s
+            if "." in s or "e" in s or "E" in s:
+                return float(s)
+            return int(s)
+
+        # Order matters: alternatives are tried left to right like a MatchFirst,
+        # so range_ref must come before cell_ref (because A1:B10 contains A1)
+        atom = Regex(
+            "|".join(
+                f"(?:{pattern})"
+                for pattern in (
+                    double_quoted,
+                    single_quoted,
+                    array_literal,
+                    range_ref,
+                    number,
+                    cell_ref,
+                    bare_identifier,
+                )
+            )
+        ).set_parse_action(process_atom)
 
         # Forward declaration for recursive expressions
         expression = Forward()
@@ -126,11 +249,13 @@ class FormulaParser:
         args_list = Optional(DelimitedList(argument))
 
         # Create the function call and apply a parse action to fix spurious empty args
+        # The name and its opening paren are matched as one token, so a plain
+        # identifier (the common case) fails here with a single regex miss
+        function_open = Regex(r"[A-Za-z_][A-Za-z0-9_]*\s*\(").set_parse_action(
+            lambda t: t[0][:-1].rstrip()
+        )
         function_call_raw = Group(
-            identifier("function")
-            + lparen.suppress()
-            + Group(args_list)("args")
-            + rparen.suppress()
+            function_open("function") + Group(args_list)("args") + rparen.suppress()
         )
 
         # Parse action to fix args structure
@@ -147,14 +272,6 @@ class FormulaParser:
 
         function_call = function_call_raw.copy().set_parse_action(fix_function_call)
 
-        # Array literal: {1,2,3} or {1,2;3,4}
-        # Arrays can contain expressions separated by commas (columns) and semicolons (rows)
-        # Use regex to match content inside braces, requiring at least one non-delimiter element
-        # This rejects empty arrays {} and delimiter-only arrays {,} {;} which Google Sheets rejects
-        from pyparsing import Regex
-
-        array_literal = Regex(r"\{[^}]*[^,;\s}][^}]*\}")
-
         # Operators (all Google Sheets operators)
         # Arithmetic: +, -, *, /, ^
         # String concatenation: &
@@ -163,14 +280,14 @@ class FormulaParser:
         # Note: : is NOT an operator - it's handled by range_ref pattern
         # We define these but don't strictly parse operator precedence
         # We just need them recognized so parsing doesn't stop at them
-        from pyparsing import CaselessKeyword, one_of
+        from pyparsing import one_of
 
-        # Use case-insensitive matching for AND and OR since they can appear in various cases
-        and_op = CaselessKeyword("AND")
-        or_op = CaselessKeyword("OR")
-        # Regular operators with one_of (space-separated for case-sensitive matching)
-        basic_operators = one_of("+ - * / ^ & = <> < > <= >=")
-        operators = and_op | or_op | basic_operators
+        # One Regex covers every binary operator. AND and OR match case-insensitively
+        # as whole words (like CaselessKeyword) and are returned uppercased; two-char
+        # comparison operators come before their one-char prefixes.
+        operators = Regex(
+            r"(?<![A-Za-z0-9_$])(?i:AND|OR)(?![A-Za-z0-9_$])|<>|<=|>=|[-+*/^&=<>]"
+        ).set_parse_action(lambda t: t[0].upper())
 
         # Unary operators (prefix operators like unary minus: -x, --x)
         # These are different from binary operators and can appear at the start of an expression
@@ -179,18 +296,8 @@ class FormulaParser:
         # Basic term: can be a function call, string, number, array, range, or identifier
         # Order matters: more specific patterns first
         # parenthesized_expr must come first (highest precedence)
-        # range_ref must come before cell_ref (because A1:B10 contains A1)
-        # function_call must come before identifier (because FUNC is also an identifier)
-        term = (
-            parenthesized_expr
-            | function_call
-            | string_literal
-            | array_literal
-            | range_ref
-            | number
-            | cell_ref
-            | identifier
-        )
+        # function_call must come before atom (because FUNC is also an identifier)
+        term = parenthesized_expr | function_call | atom
 
         # Allow zero or more unary operators before a term
         # This enables patterns like: -(expr), --(expr), +--(expr), etc.
@@ -216,7 +323,7 @@ class FormulaParser:
 
         # For parsing the entire formula, we allow multiple expressions
         # This handles cases like: FUNC(x) + FUNC(y)
-        self.grammar = expression
+        return expression
 
     def parse(self, formula: str) -> ParseResults:
         """
@@ -226,18 +333,43 @@ class FormulaParser:
             formula: Formula text to parse
 
         Returns:
-            ParseResults object representing the AST
+            ParseResults object representing the AST. Results are memoized per
+            normalized formula text and shared between callers; do not mutate.
 
         Raises:
             ParseException: If formula cannot be parsed
         """
-        # Normalize: strip leading = and whitespace
-        normalized = formula.lstrip("=").strip()
+        # Normalize: strip surrounding whitespace and the single leading = that
+        # formulas are entered with (whitespace before or after it is allowed)
+        normalized = formula.strip()
+        if normalized.startswith("="):
+            normalized = normalized[1:].lstrip()
+        return self._parse_normalized(normalized)
+
+    def _parse_uncached(self, normalized: str) -> ParseResults:
+        """Parse normalized formula text with the grammar (backs the parse cache)."""
         result = self.grammar.parse_string(normalized, parse_all=True)
+        _cache_put(self._source_cache, result, normalized)
         return result
 
+    def validate(self, formula: str) -> bool:
+        """
+        Check whether a formula parses, without raising.
+
+        Args:
+            formula: Formula text to check
+
+        Returns:
+            True if the formula parses, False otherwise
+        """
+        try:
+            self.parse(formula)
+        except ParseException:
+            return False
+        return True
+
     def extract_function_calls(
-        self, ast: ParseResults, named_functions: Set[str]
+        self, ast: ParseResults, named_functions: AbstractSet[str]
     ) -> List[Dict[str, Any]]:
         """
         Extract function calls by walking the AST.
@@ -247,51 +379,72 @@ class FormulaParser:
             named_functions: Set of named function names to look for
 
         Returns:
-            List of function call dictionaries sorted by depth (deepest first)
+            List of function call dictionaries sorted by depth (deepest first).
+            Each dictionary (and its args list) is a fresh copy the caller may modify.
         """
+        if _cache_get(self._calls_cache, ast) is None:
+            # Before the first walk of an AST from parse(), check the source
+            # text: a name that never appears in it cannot be called
+            source = _cache_get(self._source_cache, ast)
+            if source is not None and not any(name in source for name in named_functions):
+                return []
+
+        # Only the filter differs between calls on the same AST, so the walk
+        # itself is done once per AST and cached. Hand out copies so callers
+        # cannot change what later lookups on this AST return.
+        return [
+            {**call, "args": list(call["args"])}
+            for call in self._find_all_calls(ast)
+            if call["name"] in named_functions
+        ]
+
+    def _find_all_calls(self, ast: ParseResults) -> List[Dict[str, Any]]:
+        """Walk the AST once and return every function call, deepest first (read-only; cached)."""
+        cached = _cache_get(self._calls_cache, ast)
+        if cached is not None:
+            return cached
+
         calls = []
+        # Walk the AST with an explicit stack of (node, depth) pairs instead of
+        # recursion. Children are pushed in reverse so they are visited left to
+        # right, matching a recursive pre-order walk.
+        stack = [(ast, 0)]
 
-        def walk(node, depth=0):
-            """Recursively walk AST to find function calls."""
+        while stack:
+            node, depth = stack.pop()
             if isinstance(node, ParseResults):
                 node_dict = node.asDict()
                 # Check if it's a function call node
                 if "function" in node_dict:
                     func_name = node_dict["function"]
-                    if func_name in named_functions:
-                        args = node_dict.get("args", [])
-                        calls.append(
-                            {"name": func_name, "args": args, "depth": depth, "node": node}
-                        )
+                    args = node_dict.get("args", [])
+                    calls.append({"name": func_name, "args": args, "depth": depth, "node": node})
                     # Walk the args
-                    if "args" in node_dict:
-                        for arg in node_dict["args"]:
-                            walk(arg, depth + 1)
+                    children, child_depth = args, depth + 1
                 else:
                     # Not a function call, walk children
-                    for item in node:
-                        walk(item, depth)
+                    children, child_depth = node, depth
             elif isinstance(node, dict):
                 # Handle dict representation (from nested ParseResults converted to dict)
-                if "function" in node:
-                    func_name = node["function"]
-                    if func_name in named_functions:
-                        args = node.get("args", [])
-                        calls.append(
-                            {"name": func_name, "args": args, "depth": depth, "node": None}
-                        )
-                    # Walk the args
-                    if "args" in node:
-                        for arg in node["args"]:
-                            walk(arg, depth + 1)
+                if "function" not in node:
+                    continue
+                func_name = node["function"]
+                args = node.get("args", [])
+                calls.append({"name": func_name, "args": args, "depth": depth, "node": None})
+                # Walk the args
+                children, child_depth = args, depth + 1
             elif isinstance(node, (list, tuple)):
-                for item in node:
-                    walk(item, depth)
+                children, child_depth = node, depth
+            else:
+                continue
 
-        walk(ast)
+            stack.extend((child, child_depth) for child in reversed(children))
 
         # Return calls sorted by depth (deepest first for bottom-up expansion)
-        return sorted(calls, key=lambda c: c["depth"], reverse=True)
+        calls.sort(key=itemgetter("depth"), reverse=True)
+
+        _cache_put(self._calls_cache, ast, calls)
+        return calls
 
     @staticmethod
     def reconstruct_call(func_name: str, args: List) -> str:
@@ -321,7 +474,7 @@ class FormulaParser:
                 inner = stringify(inner_expr)
                 return f"({inner})"
             # Check if it's a marked string literal
-            if isinstance(arg, tuple) and len(arg) == 2 and arg[0] == "__STRING_LITERAL__":
+            if isinstance(arg, tuple) and len(arg) == 2 and arg[0] == STRING_LITERAL:
                 # It's a quoted string literal, add quotes back
                 return f'"{arg[1]}"'
             if isinstance(arg, str):
@@ -383,12 +536,10 @@ class FormulaParser:
             return str(arg)
 
         # Join arguments with commas (no spaces for empty arguments)
-        stringified_args = [stringify(arg) for arg in args]
-        # Add spaces around commas only if arguments are non-empty
         # This handles IF(,,) correctly instead of IF(, , )
-        args_str_with_spaces = ""
-        for i, arg_str in enumerate(stringified_args):
-            if i > 0:
-                args_str_with_spaces += ", " if arg_str else ","
-            args_str_with_spaces += arg_str
-        return f"{func_name}({args_str_with_spaces})"
+        stringified_args = (stringify(arg) for arg in args)
+        first = next(stringified_args, "")
+        rest = "".join(
+            (_ARG_SEPARATOR if arg_str else ",") + arg_str for arg_str in stringified_args
+        )
+        return f"{func_name}({first}{rest})"
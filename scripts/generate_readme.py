@@ -8,22 +8,48 @@ This script:
 3. Generates README.md with a list of formulas
 """
 
+import os
 import re
 import sys
+from array import array
+from collections import deque
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Tuple, Union
 
 import yaml
-from formula_parser import FormulaParser, strip_comments
+from formula_parser import STRING_LITERAL, FormulaParser, strip_comments
 from pyparsing import ParseException, ParseResults
 
 
+# Prefer the libyaml-backed loader; it builds the same objects as safe_load
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
 class ValidationError(Exception):
     """Raised when a YAML file doesn't meet the schema requirements."""
 
     pass
 
 
+# (field, accepted type(s), type description used in error messages),
+# checked in this order
+_REQUIRED_FIELDS: Tuple[Tuple[str, Union[type, Tuple[type, ...]], str], ...] = (
+    ("name", str, "a string"),
+    ("version", (str, float, int), "a string or number"),
+    ("description", str, "a string"),
+    ("parameters", list, "a list"),
+    ("formula", str, "a string"),
+)
+_OPTIONAL_FIELDS = ("notes",)
+_ALLOWED_FIELDS = frozenset(field for field, _, _ in _REQUIRED_FIELDS) | frozenset(_OPTIONAL_FIELDS)
+_REQUIRED_PARAMETER_FIELDS = ("name", "description")
+
+
 def validate_formula_yaml(data: Dict[str, Any], filename: str) -> None:
     """
     Validate that a YAML file meets the formula schema.
@@ -45,44 +71,29 @@ def validate_formula_yaml(data: Dict[str, Any], filename: str) -> None:
     Raises:
         ValidationError: If validation fails
     """
-    required_fields = ["name", "version", "description", "parameters", "formula"]
-    optional_fields = ["notes"]
-
     # Check required fields exist and are not empty
-    for field in required_fields:
+    for field, _, _ in _REQUIRED_FIELDS:
         if field not in data:
             raise ValidationError(f"{filename}: Missing required field '{field}'")
-        if data[field] is None or (isinstance(data[field], str) and not data[field].strip()):
+        value = data[field]
+        if value is None or (isinstance(value, str) and not value.strip()):
             raise ValidationError(f"{filename}: Required field '{field}' is empty")
 
     # Validate field types
-    if not isinstance(data["name"], str):
-        raise ValidationError(f"{filename}: Field 'name' must be a string")
-
-    if not isinstance(data["version"], (str, float, int)):
-        raise ValidationError(f"{filename}: Field 'version' must be a string or number")
-
-    if not isinstance(data["description"], str):
-        raise ValidationError(f"{filename}: Field 'description' must be a string")
-
-    if not isinstance(data["parameters"], list):
-        raise ValidationError(f"{filename}: Field 'parameters' must be a list")
-
-    if not isinstance(data["formula"], str):
-        raise ValidationError(f"{filename}: Field 'formula' must be a string")
+    for field, expected_type, type_name in _REQUIRED_FIELDS:
+        if not isinstance(data[field], expected_type):
+            raise ValidationError(f"{filename}: Field '{field}' must be {type_name}")
 
     # Validate parameters structure
     for i, param in enumerate(data["parameters"]):
         if not isinstance(param, dict):
             raise ValidationError(f"{filename}: Parameter {i} must be a dictionary")
-        if "name" not in param:
-            raise ValidationError(f"{filename}: Parameter {i} missing required field 'name'")
-        if "description" not in param:
-            raise ValidationError(f"{filename}: Parameter {i} missing required field 'description'")
+        for field in _REQUIRED_PARAMETER_FIELDS:
+            if field not in param:
+                raise ValidationError(f"{filename}: Parameter {i} missing required field '{field}'")
 
     # Check for unexpected fields
-    all_allowed_fields = set(required_fields + optional_fields)
-    unexpected_fields = set(data.keys()) - all_allowed_fields
+    unexpected_fields = data.keys() - _ALLOWED_FIELDS
     if unexpected_fields:
         print(f"Warning: {filename} contains unexpected fields: {', '.join(unexpected_fields)}")
 
@@ -101,17 +112,20 @@ def build_dependency_graph(
         Dict mapping formula names to list of dependencies (formulas they call)
     """
     graph = {}
-    named_functions = {f["name"] for f in formulas}
+    # Intern names so graph keys and the dependency names parsed out of each
+    # formula are the same objects, letting dict lookups match by identity
+    names = [sys.intern(f["name"]) for f in formulas]
+    # Pass the filter per call rather than changing the caller's parser defaults
+    named_functions = frozenset(names)
 
-    for formula in formulas:
-        name = formula["name"]
+    for name, formula in zip(names, formulas):
         formula_text = formula["formula"]
 
         try:
             ast = parser.parse(formula_text)
             calls = parser.extract_function_calls(ast, named_functions)
             # Get unique dependencies
-            dependencies = list({c["name"] for c in calls})
+            dependencies = list({sys.intern(c["name"]) for c in calls})
         except ParseException:
             # Formula doesn't parse or has no function calls
             print(f"  Note: {name} formula doesn't call other named functions")
@@ -122,41 +136,158 @@ def build_dependency_graph(
     return graph
 
 
+def dependency_graph_csr(
+    graph: Dict[str, List[str]],
+) -> Tuple[List[str], "array[int]", "array[int]"]:
+    """
+    Flatten a dependency graph into compressed sparse row (CSR) arrays.
+
+    Args:
+        graph: Dependency graph
+
+    Returns:
+        Tuple of (names, indptr, indices). Node i is names[i] and its
+        dependencies are indices[indptr[i]:indptr[i + 1]]. The graph's keys come
+        first, in order; names that only appear as dependencies follow them.
+    """
+    names = list(graph)
+    node_ids = {name: i for i, name in enumerate(names)}
+    indptr = array("i", [0])
+    indices = array("i")
+
+    for name in graph:
+        for dependency in graph[name]:
+            node_id = node_ids.get(dependency)
+            if node_id is None:
+                node_id = node_ids[dependency] = len(names)
+                names.append(dependency)
+            indices.append(node_id)
+        indptr.append(len(indices))
+
+    # Dependency-only nodes have no outgoing edges
+    indptr.extend([len(indices)] * (len(names) - len(graph)))
+    return names, indptr, indices
+
+
+def _shortest_cycle(
+    start: int, members: "set[int]", indptr: "array[int]", indices: "array[int]"
+) -> List[int]:
+    """Return the shortest path from start back to itself within a strongly connected component."""
+    parents = {start: start}
+    queue = deque([start])
+    while queue:
+        node = queue.popleft()
+        for neighbor in indices[indptr[node] : indptr[node + 1]]:
+            if neighbor == start:
+                path = [node]
+                while path[-1] != start:
+                    path.append(parents[path[-1]])
+                path.reverse()
+                path.append(start)
+                return path
+            if neighbor in members and neighbor not in parents:
+                parents[neighbor] = node
+                queue.append(neighbor)
+    raise AssertionError("strongly connected component has no cycle through its start")
+
+
+def _iter_cycles(graph: Dict[str, List[str]]) -> Iterator[Tuple[int, str]]:
+    """
+    Yield (earliest node id, description) for each cycle as Tarjan's algorithm finds it.
+
+    Every strongly connected component with more than one formula, or a formula
+    that calls itself, yields once, as the shortest cycle through its earliest
+    formula. Components complete in reverse topological order, not graph order.
+    """
+    names, indptr, indices = dependency_graph_csr(graph)
+    node_count = len(names)
+    # Discovery index (-1 = unvisited) and lowest index reachable, per node
+    index = array("i", [-1]) * node_count
+    lowlink = array("i", [0]) * node_count
+    on_stack = bytearray(node_count)
+    next_edge = indptr[:-1]
+    component_stack: List[int] = []
+    counter = 0
+
+    for root in range(len(graph)):
+        if index[root] != -1:
+            continue
+        index[root] = lowlink[root] = counter
+        counter += 1
+        component_stack.append(root)
+        on_stack[root] = 1
+        call_stack = [root]
+
+        while call_stack:
+            node = call_stack[-1]
+            edge = next_edge[node]
+            if edge < indptr[node + 1]:
+                next_edge[node] = edge + 1
+                neighbor = indices[edge]
+                if index[neighbor] == -1:
+                    index[neighbor] = lowlink[neighbor] = counter
+                    counter += 1
+                    component_stack.append(neighbor)
+                    on_stack[neighbor] = 1
+                    call_stack.append(neighbor)
+                elif on_stack[neighbor] and index[neighbor] < lowlink[node]:
+                    lowlink[node] = index[neighbor]
+                continue
+
+            # All edges explored: propagate lowlink and close a component at its root
+            call_stack.pop()
+            if call_stack and lowlink[node] < lowlink[call_stack[-1]]:
+                lowlink[call_stack[-1]] = lowlink[node]
+            if lowlink[node] != index[node]:
+                continue
+
+            component = []
+            while True:
+                member = component_stack.pop()
+                on_stack[member] = 0
+                component.append(member)
+                if member == node:
+                    break
+            calls_itself = node in indices[indptr[node] : indptr[node + 1]]
+            if len(component) > 1 or calls_itself:
+                start = min(component)
+                cycle = _shortest_cycle(start, set(component), indptr, indices)
+                yield start, " → ".join(names[i] for i in cycle)
+
+
 def detect_cycles(graph: Dict[str, List[str]]) -> List[str]:
     """
-    Detect circular dependencies using DFS with color marking.
+    Detect circular dependencies with Tarjan's strongly connected components.
+
+    Every component with more than one formula, or a formula that calls itself,
+    is reported once, as the shortest cycle through its earliest formula.
 
     Args:
         graph: Dependency graph
 
     Returns:
-        List of cycle descriptions (empty if no cycles)
+        List of cycle descriptions (empty if no cycles), in graph order
     """
-    white, gray, black = 0, 1, 2
-    color = dict.fromkeys(graph, white)
-    cycles = []
+    return [description for _, description in sorted(_iter_cycles(graph))]
 
-    def dfs(node: str, path: List[str]):
-        """DFS helper function."""
-        color[node] = gray
-        path.append(node)
 
-        for neighbor in graph.get(node, []):
-            if color[neighbor] == gray:
-                # Found a cycle
-                cycle_start = path.index(neighbor)
-                cycle = path[cycle_start:] + [neighbor]
-                cycles.append(" → ".join(cycle))
-            elif color[neighbor] == white:
-                dfs(neighbor, path[:])
+def find_any_cycle(graph: Dict[str, List[str]]) -> Union[str, None]:
+    """
+    Return the first circular dependency found, stopping the search there.
+
+    Args:
+        graph: Dependency graph
 
-        color[node] = black
+    Returns:
+        A cycle description, or None if the graph has no cycles
+    """
+    return next((description for _, description in _iter_cycles(graph)), None)
 
-    for node in graph:
-        if color[node] == white:
-            dfs(node, [])
 
-    return cycles
+@lru_cache(maxsize=256)
+def _parameter_pattern(param_name: str) -> "re.Pattern[str]":
+    """Compile (once per name) the whole-word pattern substitute_arguments replaces."""
+    return re.compile(r"\b" + re.escape(param_name) + r"\b")
 
 
 def substitute_arguments(
@@ -188,7 +319,7 @@ def substitute_arguments(
         # Handle empty argument placeholder
         if arg == "__EMPTY__":
             arg_str = ""
-        elif isinstance(arg, tuple) and len(arg) == 2 and arg[0] == "__STRING_LITERAL__":
+        elif isinstance(arg, tuple) and len(arg) == 2 and arg[0] == STRING_LITERAL:
             # It's a marked string literal, add quotes back
             arg_str = f'"{arg[1]}"'
         elif isinstance(arg, str):
@@ -210,7 +341,7 @@ def substitute_arguments(
                         inner_expr = list(inner_expr)
                     inner = stringify_item(inner_expr)
                     return f"({inner})"
-                if isinstance(item, tuple) and len(item) == 2 and item[0] == "__STRING_LITERAL__":
+                if isinstance(item, tuple) and len(item) == 2 and item[0] == STRING_LITERAL:
                     return f'"{item[1]}"'
                 if isinstance(item, dict) and "function" in item:
                     return FormulaParser.reconstruct_call(item["function"], item.get("args", []))
@@ -241,8 +372,7 @@ def substitute_arguments(
 
         # Use word boundaries to avoid partial replacements
         # Won't replace 'range' in 'input_range'
-        pattern = r"\b" + re.escape(param_name) + r"\b"
-        result = re.sub(pattern, arg_str, result)
+        result = _parameter_pattern(param_name).sub(arg_str, result)
 
     return result
 
@@ -263,7 +393,7 @@ def expand_argument(
             inner_expr = list(inner_expr)
         inner = expand_argument(inner_expr, all_formulas, parser, expanded_cache)
         return f"({inner})"
-    if isinstance(arg, tuple) and len(arg) == 2 and arg[0] == "__STRING_LITERAL__":
+    if isinstance(arg, tuple) and len(arg) == 2 and arg[0] == STRING_LITERAL:
         return f"{chr(34)}{arg[1]}{chr(34)}"
     if isinstance(arg, (int, float)):
         return str(arg)
@@ -428,6 +558,17 @@ def expand_formula(
     return result
 
 
+def _scan_formula_files(formulas_dir: Path) -> List["os.DirEntry[str]"]:
+    """List the .yaml files in formulas_dir, sorted by name, in one directory pass."""
+    try:
+        with os.scandir(formulas_dir) as entries:
+            yaml_files = [e for e in entries if e.name.endswith(".yaml") and e.is_file()]
+    except FileNotFoundError:
+        return []
+    yaml_files.sort(key=attrgetter("name"))
+    return yaml_files
+
+
 def load_and_validate_formulas(root_dir: Path) -> List[Dict[str, Any]]:
     """
     Load all .yaml files from formulas directory and validate them.
@@ -443,7 +584,7 @@ def load_and_validate_formulas(root_dir: Path) -> List[Dict[str, Any]]:
     """
     formulas = []
     formulas_dir = root_dir / "formulas"
-    yaml_files = sorted(formulas_dir.glob("*.yaml"))
+    yaml_files = _scan_formula_files(formulas_dir)
 
     if not yaml_files:
         print("Warning: No .yaml files found in formulas directory")
@@ -451,8 +592,8 @@ def load_and_validate_formulas(root_dir: Path) -> List[Dict[str, Any]]:
 
     for yaml_file in yaml_files:
         try:
-            with open(yaml_file, encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            with open(yaml_file.path, encoding="utf-8") as f:
+                data = yaml.load(f, Loader=SafeLoader)
 
             if data is None:
                 raise ValidationError(f"{yaml_file.name}: File is empty")
@@ -477,9 +618,9 @@ def load_and_validate_formulas(root_dir: Path) -> List[Dict[str, Any]]:
         print("\nChecking for circular dependencies...")
         parser = FormulaParser()
         graph = build_dependency_graph(formulas, parser)
-        cycles = detect_cycles(graph)
-
-        if cycles:
+        # Only collect the full list (for the error message) once a cycle is known
+        if find_any_cycle(graph) is not None:
+            cycles = detect_cycles(graph)
             cycle_desc = "\n".join(f"  - {cycle}" for cycle in cycles)
             raise ValidationError(f"Circular dependencies detected:\n{cycle_desc}")
 
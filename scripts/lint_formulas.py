@@ -13,18 +13,51 @@ Exit codes:
     1: One or more lint errors found
 """
 
+import os
+import re
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import AbstractSet, Any, Callable, Dict, List, Tuple, Union
 
 import yaml
 from formula_parser import FormulaParser, strip_comments
 from pyparsing import ParseException
 
 
+# Prefer the libyaml-backed loader; it builds the same objects as safe_load
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Marks a key absent from a mapping, distinct from a key whose value is None
+_MISSING = object()
+# A formula whose first non-whitespace character is '='
+_LEADING_EQUALS = re.compile(r"\s*=")
+# A formula wrapped in LAMBDA(...), ignoring case and leading whitespace
+_LAMBDA_START = re.compile(r"\s*LAMBDA\(", re.IGNORECASE)
+# Lines that would split or re-scope a document once files are joined into one stream
+_DOCUMENT_MARKER = re.compile(rb"^(?:---|\.\.\.|%)", re.MULTILINE)
+# Byte order marks; mid-stream they would end up inside the file's first key
+_BYTE_ORDER_MARKS = (b"\xef\xbb\xbf", b"\xff\xfe", b"\xfe\xff")
+# Characters the LAMBDA paren walk reacts to; everything else is skipped
+_LAMBDA_TOKENS = re.compile(r'[\\"()]')
+
+
+@lru_cache(maxsize=None)
+def _shared_parser() -> FormulaParser:
+    """Return the process-wide parser so its grammar is built only once."""
+    return FormulaParser()
+
+
 class LintRule:
     """Base class for lint rules."""
 
+    # Top-level keys a document must have for check() to do anything;
+    # the linter skips the rule for documents missing any of them
+    REQUIRED_KEYS: AbstractSet[str] = frozenset()
+
     def __init__(self, name: str, description: str):
         self.name = name
         self.description = description
@@ -43,9 +76,15 @@ class LintRule:
         raise NotImplementedError("Subclasses must implement check()")
 
 
+# Signature of LintRule.check: (file_path, data) -> (errors, warnings)
+_RuleCheck = Callable[[Path, Dict[str, Any]], Tuple[List[str], List[str]]]
+
+
 class NoLeadingEqualsRule(LintRule):
     """Rule: Formula field must not start with '=' character."""
 
+    REQUIRED_KEYS = frozenset({"formula"})
+
     def __init__(self):
         super().__init__(
             name="no-leading-equals", description="Formula field must not start with '=' character"
@@ -66,8 +105,7 @@ class NoLeadingEqualsRule(LintRule):
             return errors, warnings  # Skip if formula is not a string
 
         # Check if formula starts with '=' (ignoring leading whitespace)
-        stripped = formula.lstrip()
-        if stripped.startswith("="):
+        if _LEADING_EQUALS.match(formula):
             errors.append(
                 f"{file_path}: Formula starts with '=' character. "
                 f"Remove the leading '=' from the formula field."
@@ -79,6 +117,8 @@ class NoLeadingEqualsRule(LintRule):
 class NoTopLevelLambdaRule(LintRule):
     """Rule: Formula field must not start with uninvoked LAMBDA wrapper."""
 
+    REQUIRED_KEYS = frozenset({"formula"})
+
     def __init__(self):
         super().__init__(
             name="no-top-level-lambda",
@@ -97,24 +137,25 @@ class NoTopLevelLambdaRule(LintRule):
             return errors, warnings  # Skip if formula is not a string
 
         # Check if formula starts with LAMBDA (ignoring leading whitespace and trailing whitespace)
-        stripped = formula.strip()
-        if stripped.upper().startswith("LAMBDA("):
+        if _LAMBDA_START.match(formula):
+            stripped = formula.strip()
             # Check if it's a self-executing LAMBDA (ends with invocation like )(0) or )(args))
             # Pattern: LAMBDA(...)(...)
 
             # Count parentheses to find where the LAMBDA definition ends
             paren_count = 0
             in_string = False
-            escape_next = False
+            escaped = -1
             lambda_end = -1
 
-            for i, char in enumerate(stripped):
-                if escape_next:
-                    escape_next = False
+            for match in _LAMBDA_TOKENS.finditer(stripped):
+                i = match.start()
+                if i == escaped:
                     continue
 
+                char = match.group()
                 if char == "\\":
-                    escape_next = True
+                    escaped = i + 1
                     continue
 
                 if char == '"':
@@ -124,7 +165,7 @@ class NoTopLevelLambdaRule(LintRule):
                 if not in_string:
                     if char == "(":
                         paren_count += 1
-                    elif char == ")":
+                    else:
                         paren_count -= 1
                         if paren_count == 0:
                             lambda_end = i
@@ -157,6 +198,8 @@ class NoTopLevelLambdaRule(LintRule):
 class RequireParameterExamplesRule(LintRule):
     """Rule: All parameters must have non-empty example values."""
 
+    REQUIRED_KEYS = frozenset({"parameters"})
+
     def __init__(self):
         super().__init__(
             name="require-parameter-examples",
@@ -192,20 +235,19 @@ class RequireParameterExamplesRule(LintRule):
 
             param_name = param.get("name", f"parameter-{i}")
 
-            # Check if example field exists
-            if "example" not in param:
+            # Check if example field exists (one lookup; None is a present value)
+            example = param.get("example", _MISSING)
+            if example is _MISSING:
                 errors.append(
                     f"{file_path}: Parameter '{param_name}' is missing 'example' field. "
                     f"Provide a concrete example value (e.g., '\"A1:B10\"', '0', 'BLANK()', etc.)"
                 )
-            else:
-                # Check if example is empty string
-                example = param.get("example")
-                if isinstance(example, str) and example == "":
-                    errors.append(
-                        f"{file_path}: Parameter '{param_name}' has empty example. "
-                        f"Provide a concrete example value (e.g., '\"A1:B10\"', '0', '\"\"', 'BLANK()', etc.)"
-                    )
+            elif example == "":
+                # Empty string example; falsy non-strings such as 0 are valid
+                errors.append(
+                    f"{file_path}: Parameter '{param_name}' has empty example. "
+                    f"Provide a concrete example value (e.g., '\"A1:B10\"', '0', '\"\"', 'BLANK()', etc.)"
+                )
 
         return errors, warnings
 
@@ -213,12 +255,14 @@ class RequireParameterExamplesRule(LintRule):
 class ValidFormulaSyntaxRule(LintRule):
     """Rule: Formula must be parseable by the pyparsing grammar."""
 
+    REQUIRED_KEYS = frozenset({"formula"})
+
     def __init__(self):
         super().__init__(
             name="valid-formula-syntax",
             description="Formula must be parseable by the pyparsing grammar",
         )
-        self.parser = FormulaParser()
+        self.parser = _shared_parser()
 
     def check(self, file_path: Path, data: Dict[str, Any]) -> Tuple[List[str], List[str]]:
         """
@@ -274,7 +318,7 @@ class FormulaLinter:
     """Main linter class that runs all validation rules."""
 
     def __init__(self):
-        self.rules: List[LintRule] = [
+        self.rules = [
             NoLeadingEqualsRule(),
             NoTopLevelLambdaRule(),
             RequireParameterExamplesRule(),
@@ -282,6 +326,17 @@ class FormulaLinter:
             # Add more rules here as needed
         ]
 
+    @property
+    def rules(self) -> List[LintRule]:
+        """Registered rules, run in order against every document."""
+        return self._rules
+
+    @rules.setter
+    def rules(self, rules: List[LintRule]) -> None:
+        self._rules = rules
+        # Dispatch table built from the rules on first use (see _rule_checks)
+        self._checks: Union[Tuple[Tuple[AbstractSet[str], _RuleCheck], ...], None] = None
+
     def lint_file(self, file_path: Path) -> Tuple[List[str], List[str]]:
         """
         Lint a single YAML file.
@@ -292,25 +347,105 @@ class FormulaLinter:
         Returns:
             Tuple of (errors, warnings)
         """
+        try:
+            # Raw bytes go straight to the YAML reader, which does its own decoding
+            with open(file_path, "rb") as f:
+                content = f.read()
+        except Exception as e:
+            return [f"{file_path}: Unexpected error: {e}"], []
+
+        return self.lint_content(file_path, content)
+
+    def lint_content(self, file_path: Path, text: Union[str, bytes]) -> Tuple[List[str], List[str]]:
+        """
+        Lint YAML text that has already been read into memory.
+
+        Args:
+            file_path: Path reported in error and warning messages
+            text: YAML document to lint, as text or UTF-8/UTF-16 encoded bytes
+
+        Returns:
+            Tuple of (errors, warnings)
+        """
+        try:
+            data = yaml.load(text, Loader=SafeLoader)
+        except yaml.YAMLError as e:
+            return [f"{file_path}: YAML parsing error: {e}"], []
+        except Exception as e:
+            return [f"{file_path}: Unexpected error: {e}"], []
+
+        return self._lint_data(file_path, data)
+
+    def lint_stream(self, paths: List[Path]) -> Tuple[int, int, int, List[str], List[str]]:
+        """
+        Lint several YAML files, parsing them as one multi-document YAML stream.
+
+        Results match calling lint_file on each path in order. Files that
+        cannot be joined safely (unreadable, or containing their own document
+        markers or directives, or starting with a byte order mark) make the
+        whole batch fall back to lint_file.
+
+        Args:
+            paths: YAML files to lint
+
+        Returns:
+            Tuple of (files_checked, error_count, warning_count, errors, warnings)
+        """
+        return _summarize(self._lint_files(paths))
+
+    def _lint_files(self, paths: List[Path]) -> List[Tuple[List[str], List[str]]]:
+        """Lint files through a single YAML stream, falling back to lint_file per file."""
+        try:
+            texts = [path.read_bytes() for path in paths]
+            if any(_DOCUMENT_MARKER.search(text) for text in texts):
+                raise ValueError("file contains YAML document markers")
+            if any(text.startswith(_BYTE_ORDER_MARKS) for text in texts):
+                raise ValueError("file starts with a byte order mark")
+            documents = list(yaml.load_all(b"\n---\n".join(texts), Loader=SafeLoader))
+            if len(documents) != len(paths):
+                raise ValueError("documents do not line up with files")
+        except Exception:
+            return [self.lint_file(path) for path in paths]
+
+        return [self._lint_data(path, data) for path, data in zip(paths, documents)]
+
+    def _rule_checks(self) -> Tuple[Tuple[AbstractSet[str], _RuleCheck], ...]:
+        """
+        Return (REQUIRED_KEYS, bound check) for each rule, built once per rule list.
+
+        The table is rebuilt when rules is reassigned or its length changes
+        (e.g. a rule is appended); replacing a rule in place requires
+        reassigning the list.
+        """
+        checks = self._checks
+        if checks is None or len(checks) != len(self._rules):
+            checks = self._checks = tuple((rule.REQUIRED_KEYS, rule.check) for rule in self._rules)
+        return checks
+
+    def _lint_data(self, file_path: Path, data: Any) -> Tuple[List[str], List[str]]:
+        """Run every rule against one parsed YAML document."""
+        checks = self._rule_checks()
+
         errors = []
         warnings = []
 
-        try:
-            with open(file_path, encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+        if not isinstance(data, dict):
+            errors.append(f"{file_path}: Invalid YAML structure (expected dictionary)")
+            return errors, warnings
 
-            if not isinstance(data, dict):
-                errors.append(f"{file_path}: Invalid YAML structure (expected dictionary)")
-                return errors, warnings
+        # An empty mapping can only match rules that require no keys
+        if not data and all(required_keys for required_keys, _ in checks):
+            return errors, warnings
 
+        try:
             # Run all rules
-            for rule in self.rules:
-                rule_errors, rule_warnings = rule.check(file_path, data)
+            keys = data.keys()
+            for required_keys, check in checks:
+                if not keys >= required_keys:
+                    continue
+                rule_errors, rule_warnings = check(file_path, data)
                 errors.extend(rule_errors)
                 warnings.extend(rule_warnings)
-
-        except yaml.YAMLError as e:
-            errors.append(f"{file_path}: YAML parsing error: {e}")
         except Exception as e:
             errors.append(f"{file_path}: Unexpected error: {e}")
 
@@ -330,19 +465,36 @@ class FormulaLinter:
             directory = Path.cwd() / "formulas"
 
         # Find all .yaml files in the formulas directory
-        yaml_files = sorted(directory.glob("*.yaml"))
+        yaml_files = _scan_yaml_files(directory)
+
+        return _summarize(self._lint_files(yaml_files))
+
+
+def _scan_yaml_files(directory: Path) -> List[Path]:
+    """List the .yaml files directly inside directory, sorted by name, in one scandir pass."""
+    try:
+        with os.scandir(directory) as entries:
+            names = [e.name for e in entries if e.name.endswith(".yaml") and e.is_file()]
+    except FileNotFoundError:
+        return []
+    names.sort()
+    return [directory / name for name in names]
+
 
-        all_errors = []
-        all_warnings = []
-        files_checked = 0
+def _summarize(
+    results: List[Tuple[List[str], List[str]]],
+) -> Tuple[int, int, int, List[str], List[str]]:
+    """Combine per-file (errors, warnings) into lint_all's summary tuple."""
+    all_errors = []
+    all_warnings = []
+    files_checked = 0
 
-        for yaml_file in yaml_files:
-            files_checked += 1
-            errors, warnings = self.lint_file(yaml_file)
-            all_errors.extend(errors)
-            all_warnings.extend(warnings)
+    for errors, warnings in results:
+        files_checked += 1
+        all_errors.extend(errors)
+        all_warnings.extend(warnings)
 
-        return files_checked, len(all_errors), len(all_warnings), all_errors, all_warnings
+    return files_checked, len(all_errors), len(all_warnings), all_errors, all_warnings
 
 
 def main():
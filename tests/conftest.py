@@ -0,0 +1,17 @@
+"""Shared pytest configuration and fixtures for the test suite."""
+
+import sys
+from pathlib import Path
+
+
+# Make the modules in scripts/ importable by name for every test module
+sys.path.insert(0, str((Path(__file__).parent.parent / "scripts").resolve()))
+
+import pytest
+from formula_parser import FormulaParser
+
+
+@pytest.fixture(scope="session")
+def parser():
+    """Share one FormulaParser, and the grammar it builds on first use, across the session."""
+    return FormulaParser()
@@ -6,30 +6,48 @@ Tests the complete README generation workflow without testing
 internal implementation details.
 """
 
-import sys
 from pathlib import Path
 
+import pytest
+import yaml
+from generate_readme import _scan_formula_files
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
 
-import pytest
+ROOT_DIR = Path(__file__).parent.parent
+
+# One test case per formula file, so pytest -n auto can spread them across workers.
+# Listed the same way load_and_validate_formulas lists them.
+FORMULA_FILES = [Path(entry.path) for entry in _scan_formula_files(ROOT_DIR / "formulas")]
+
+
+@pytest.fixture(scope="session")
+def generate_readme():
+    """Import the generate_readme module once, when a test first needs it."""
+    import generate_readme
+
+    return generate_readme
+
+
+@pytest.fixture(scope="session")
+def loaded_formulas(generate_readme):
+    """Load and validate the repository's formulas once per session.
+
+    Validation includes cycle detection, so any ValidationError (including
+    circular dependencies) fails every test that depends on this fixture.
+    """
+    try:
+        return generate_readme.load_and_validate_formulas(ROOT_DIR)
+    except generate_readme.ValidationError as e:
+        pytest.fail(f"Formula validation failed: {e}")
 
 
 class TestReadmeGeneration:
     """Integration tests for README generation."""
 
-    def test_generate_readme_runs_without_error(self):
+    def test_generate_readme_runs_without_error(self, loaded_formulas):
         """Test that generate_readme.py can be imported and run."""
-        import generate_readme
-
-        # Should be able to load formulas
-        root_dir = Path(__file__).parent.parent
-        try:
-            formulas = generate_readme.load_and_validate_formulas(root_dir)
-            assert isinstance(formulas, list)
-            assert len(formulas) > 0
-        except generate_readme.ValidationError as e:
-            pytest.fail(f"Formula validation failed: {e}")
+        assert isinstance(loaded_formulas, list)
+        assert len(loaded_formulas) > 0
 
     def test_formula_parser_can_be_created(self):
         """Test that FormulaParser can be instantiated."""
@@ -56,10 +74,19 @@ class TestReadmeGeneration:
         assert "LET(" in result
         assert "x, 5" in result
 
-    def test_dependency_graph_construction(self):
+    def test_strip_comments_keeps_markers_inside_strings(self):
+        """Test that // and /* inside string literals are not treated as comments."""
+        from formula_parser import strip_comments
+
+        formula = 'CONCAT("https://example.com", "/* not a comment */") // real comment'
+
+        result = strip_comments(formula)
+
+        assert result == 'CONCAT("https://example.com", "/* not a comment */") '
+
+    def test_dependency_graph_construction(self, generate_readme):
         """Test building dependency graph from formulas."""
         from formula_parser import FormulaParser
-        from generate_readme import build_dependency_graph
 
         formulas = [
             {"name": "A", "formula": "B(x)"},
@@ -68,36 +95,61 @@ class TestReadmeGeneration:
         ]
 
         parser = FormulaParser()
-        graph = build_dependency_graph(formulas, parser)
+        graph = generate_readme.build_dependency_graph(formulas, parser)
 
         assert "A" in graph
         assert "B" in graph
         assert "C" in graph
+        assert graph["A"] == ["B"]
+        assert graph["C"] == ["A"]
 
-    def test_cycle_detection_finds_cycles(self):
+    def test_cycle_detection_finds_cycles(self, generate_readme):
         """Test that cycle detection works."""
-        from generate_readme import detect_cycles
-
         # Graph with cycle: A -> B -> A
         graph_with_cycle = {"A": ["B"], "B": ["A"]}
 
-        cycles = detect_cycles(graph_with_cycle)
+        cycles = generate_readme.detect_cycles(graph_with_cycle)
         assert len(cycles) > 0
 
         # Graph without cycle
         graph_without_cycle = {"A": ["B"], "B": ["C"], "C": []}
 
-        cycles = detect_cycles(graph_without_cycle)
+        cycles = generate_readme.detect_cycles(graph_without_cycle)
         assert len(cycles) == 0
 
+    def test_cycle_detection_reports_cycle_path(self, generate_readme):
+        """Test that a detected cycle is reported as the path that closes it."""
+        graph = {"A": ["B"], "B": ["C"], "C": ["A", "D"], "D": []}
+
+        assert generate_readme.detect_cycles(graph) == ["A → B → C → A"]
+
+    def test_cycle_detection_reports_each_cycle_once(self, generate_readme):
+        """Test that self-calls and separate cycles are each reported once, in graph order."""
+        graph = {"A": ["A"], "B": ["C"], "C": ["B"], "D": ["E"], "E": ["D", "B"]}
+
+        assert generate_readme.detect_cycles(graph) == ["A → A", "B → C → B", "D → E → D"]
+
+    def test_find_any_cycle(self, generate_readme):
+        """Test that find_any_cycle returns one cycle, or None for an acyclic graph."""
+        assert generate_readme.find_any_cycle({"A": ["B"], "B": ["A"]}) == "A → B → A"
+        assert generate_readme.find_any_cycle({"A": ["B"], "B": []}) is None
+
+    def test_dependency_graph_csr_layout(self, generate_readme):
+        """Test the CSR arrays built from a dependency graph."""
+        names, indptr, indices = generate_readme.dependency_graph_csr(
+            {"A": ["B", "C"], "B": [], "C": ["X"]}
+        )
+
+        assert names == ["A", "B", "C", "X"]
+        assert list(indptr) == [0, 2, 2, 3, 3]
+        assert list(indices) == [1, 2, 3]
+
 
 class TestFormulaValidation:
     """Test formula YAML validation."""
 
-    def test_valid_formula_passes_validation(self):
+    def test_valid_formula_passes_validation(self, generate_readme):
         """Test that a valid formula passes validation."""
-        from generate_readme import validate_formula_yaml
-
         valid_data = {
             "name": "TEST",
             "version": "1.0.0",
@@ -108,14 +160,12 @@ class TestFormulaValidation:
 
         # Should not raise
         try:
-            validate_formula_yaml(valid_data, "test.yaml")
+            generate_readme.validate_formula_yaml(valid_data, "test.yaml")
         except Exception as e:
             pytest.fail(f"Valid formula failed validation: {e}")
 
-    def test_missing_name_fails_validation(self):
+    def test_missing_name_fails_validation(self, generate_readme):
         """Test that missing name field fails validation."""
-        from generate_readme import ValidationError, validate_formula_yaml
-
         invalid_data = {
             "version": "1.0.0",
             "description": "Missing name",
@@ -123,13 +173,11 @@ class TestFormulaValidation:
             "formula": "x",
         }
 
-        with pytest.raises(ValidationError, match="name"):
-            validate_formula_yaml(invalid_data, "test.yaml")
+        with pytest.raises(generate_readme.ValidationError, match="name"):
+            generate_readme.validate_formula_yaml(invalid_data, "test.yaml")
 
-    def test_missing_formula_fails_validation(self):
+    def test_missing_formula_fails_validation(self, generate_readme):
         """Test that missing formula field fails validation."""
-        from generate_readme import ValidationError, validate_formula_yaml
-
         invalid_data = {
             "name": "TEST",
             "version": "1.0.0",
@@ -137,13 +185,11 @@ class TestFormulaValidation:
             "parameters": [],
         }
 
-        with pytest.raises(ValidationError, match="formula"):
-            validate_formula_yaml(invalid_data, "test.yaml")
+        with pytest.raises(generate_readme.ValidationError, match="formula"):
+            generate_readme.validate_formula_yaml(invalid_data, "test.yaml")
 
-    def test_empty_description_fails_validation(self):
+    def test_empty_description_fails_validation(self, generate_readme):
         """Test that empty description fails validation."""
-        from generate_readme import ValidationError, validate_formula_yaml
-
         invalid_data = {
             "name": "TEST",
             "version": "1.0.0",
@@ -152,49 +198,37 @@ class TestFormulaValidation:
             "formula": "x",
         }
 
-        with pytest.raises(ValidationError, match="description"):
-            validate_formula_yaml(invalid_data, "test.yaml")
+        with pytest.raises(generate_readme.ValidationError, match="description"):
+            generate_readme.validate_formula_yaml(invalid_data, "test.yaml")
 
 
 class TestExistingFormulas:
     """Test that existing formulas in the repository are valid."""
 
-    def test_all_existing_formulas_are_valid(self):
+    def test_all_existing_formulas_are_valid(self, loaded_formulas):
         """Test that all existing formula files pass validation."""
-        import generate_readme
+        if not FORMULA_FILES:
+            pytest.skip("Formulas directory not found or empty")
 
-        root_dir = Path(__file__).parent.parent
-        formulas_dir = root_dir / "formulas"
+        assert len(loaded_formulas) == len(FORMULA_FILES)
 
-        if not formulas_dir.exists():
-            pytest.skip("Formulas directory not found")
+    @pytest.mark.parametrize("yaml_path", FORMULA_FILES, ids=lambda path: path.name)
+    def test_formula_file_is_valid(self, generate_readme, parser, yaml_path):
+        """Test that a single formula file passes validation and its formula parses."""
+        from formula_parser import strip_comments
 
-        yaml_files = list(formulas_dir.glob("*.yaml"))
-        assert len(yaml_files) > 0, "No YAML files found"
+        data = yaml.safe_load(yaml_path.read_text(encoding="utf-8"))
+        generate_readme.validate_formula_yaml(data, yaml_path.name)
 
-        # Load and validate all formulas
-        try:
-            formulas = generate_readme.load_and_validate_formulas(root_dir)
-            assert len(formulas) == len(yaml_files)
-        except generate_readme.ValidationError as e:
-            pytest.fail(f"Formula validation failed: {e}")
+        assert parser.validate(strip_comments(data["formula"])), (
+            f"{yaml_path.name}: formula does not parse"
+        )
 
-    def test_no_circular_dependencies_in_formulas(self):
+    def test_no_circular_dependencies_in_formulas(self, loaded_formulas):
         """Test that formulas don't have circular dependencies."""
-        import generate_readme
-
-        root_dir = Path(__file__).parent.parent
-
-        try:
-            formulas = generate_readme.load_and_validate_formulas(root_dir)
-
-            # load_and_validate_formulas includes cycle detection
-            # If we get here, there are no cycles
-            assert len(formulas) > 0
-        except generate_readme.ValidationError as e:
-            if "Circular" in str(e):
-                pytest.fail(f"Circular dependencies found: {e}")
-            raise
+        # load_and_validate_formulas includes cycle detection
+        # If we get here, there are no cycles
+        assert len(loaded_formulas) > 0
 
 
 if __name__ == "__main__":
@@ -12,256 +12,288 @@ Test organization:
 4. TestExistingFormulas - regression test for all formulas in repository
 """
 
-import sys
-import tempfile
 from pathlib import Path
 
-
-sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
-
+import lint_formulas
 import pytest
 import yaml
 from lint_formulas import (
     FormulaLinter,
+    LintRule,
     NoLeadingEqualsRule,
     NoTopLevelLambdaRule,
     RequireParameterExamplesRule,
 )
 
 
+@pytest.fixture(scope="session")
+def linter():
+    """Share one FormulaLinter across the session; its rules keep no per-file state."""
+    return FormulaLinter()
+
+
+def assert_one_error(errors, warnings, *tokens, warning_token=None):
+    """Assert exactly one error containing every token (case-insensitive).
+
+    With warning_token, also expect exactly one warning containing it;
+    otherwise expect no warnings.
+    """
+    expected_warnings = 0 if warning_token is None else 1
+    assert (len(errors), len(warnings)) == (1, expected_warnings), (errors, warnings)
+    for token in tokens:
+        assert token.lower() in errors[0].lower()
+    if warning_token is not None:
+        assert warning_token.lower() in warnings[0].lower()
+
+
+# Directories of formula files shared by the lint_all tests, keyed by subdirectory
+LINT_ALL_CORPUS = {
+    "valid_only": {
+        f"formula{i}.yaml": {"name": f"FUNC{i}", "formula": "LET(x, 1, x)"} for i in range(3)
+    },
+    "with_error": {
+        "valid.yaml": {"name": "VALID", "formula": "LET(x, 1, x)"},
+        "invalid.yaml": {"name": "INVALID", "formula": "=SUM(A1:A10)"},
+    },
+    "with_warning": {
+        "warning.yaml": {"name": "WARNING_FUNC", "formula": "LAMBDA(x, x+1)(0)"},
+    },
+    "empty": {},
+}
+
+
+@pytest.fixture(scope="module")
+def formula_corpus(tmp_path_factory):
+    """Write LINT_ALL_CORPUS to disk once per module and return its root directory."""
+    root = tmp_path_factory.mktemp("formula_corpus")
+    for directory, files in LINT_ALL_CORPUS.items():
+        (root / directory).mkdir()
+        for filename, data in files.items():
+            with open(root / directory / filename, "w") as f:
+                yaml.dump(data, f)
+    return root
+
+
+# Rules only read the data passed to check(), so one instance serves every test
+@pytest.fixture(scope="module")
+def leading_equals_rule():
+    return NoLeadingEqualsRule()
+
+
+@pytest.fixture(scope="module")
+def top_level_lambda_rule():
+    return NoTopLevelLambdaRule()
+
+
+@pytest.fixture(scope="module")
+def parameter_examples_rule():
+    return RequireParameterExamplesRule()
+
+
 class TestNoLeadingEqualsRule:
     """Test the NoLeadingEqualsRule for detecting leading = character."""
 
-    def setup_method(self):
-        """Initialize rule before each test."""
-        self.rule = NoLeadingEqualsRule()
-
-    def test_formula_without_leading_equals_passes(self):
+    def test_formula_without_leading_equals_passes(self, leading_equals_rule):
         """Test that a valid formula without = passes with no errors."""
         data = {"formula": "LET(x, 1, x)"}
-        errors, warnings = self.rule.check(Path("test.yaml"), data)
+        errors, warnings = leading_equals_rule.check(Path("test.yaml"), data)
 
-        assert len(errors) == 0
-        assert len(warnings) == 0
+        assert (errors, warnings) == ([], [])
 
-    def test_formula_with_leading_equals_fails(self):
+    def test_formula_with_leading_equals_fails(self, leading_equals_rule):
         """Test that formula starting with = produces an error."""
         data = {"formula": "=SUM(A1:A10)"}
-        errors, warnings = self.rule.check(Path("test.yaml"), data)
+        errors, warnings = leading_equals_rule.check(Path("test.yaml"), data)
 
-        assert len(errors) == 1
-        assert "starts with" in errors[0].lower()
-        assert len(warnings) == 0
+        assert_one_error(errors, warnings, "starts with")
 
-    def test_formula_with_whitespace_and_leading_equals_fails(self):
+    def test_formula_with_whitespace_and_leading_equals_fails(self, leading_equals_rule):
         """Test that formula with leading whitespace and = fails.
 
         Whitespace should be stripped before checking for =.
         """
         data = {"formula": "   =SUM(A1:A10)"}
-        errors, warnings = self.rule.check(Path("test.yaml"), data)
+        errors, warnings = leading_equals_rule.check(Path("test.yaml"), data)
 
-        assert len(errors) == 1
-        assert len(warnings) == 0
+        assert_one_error(errors, warnings, "starts with")
 
-    def test_missing_formula_field_passes(self):
+    def test_missing_formula_field_passes(self, leading_equals_rule):
         """Test that missing formula field is silently skipped.
 
         Other validators (schema validation) will catch missing formula field.
         """
         data = {"name": "MYFUNCTION"}
-        errors, warnings = self.rule.check(Path("test.yaml"), data)
+        errors, warnings = leading_equals_rule.check(Path("test.yaml"), data)
 
-        assert len(errors) == 0
-        assert len(warnings) == 0
+        assert (errors, warnings) == ([], [])
 
-    def test_non_string_formula_passes(self):
+    def test_non_string_formula_passes(self, leading_equals_rule):
         """Test that non-string formula field is skipped.
 
         This is a data type issue that schema validation should catch.
         """
         data = {"formula": 123}
-        errors, warnings = self.rule.check(Path("test.yaml"), data)
+        errors, warnings = leading_equals_rule.check(Path("test.yaml"), data)
 
-        assert len(errors) == 0
-        assert len(warnings) == 0
+        assert (errors, warnings) == ([], [])
 
-    def test_formula_with_equals_in_middle_passes(self):
+    def test_formula_with_equals_in_middle_passes(self, leading_equals_rule):
         """Test that = in the middle of formula is allowed.
 
         Only leading = is invalid. Comparisons like '=' are allowed.
         """
         data = {"formula": 'IF(x=5, "equal", "not equal")'}
-        errors, warnings = self.rule.check(Path("test.yaml"), data)
+        errors, warnings = leading_equals_rule.check(Path("test.yaml"), data)
 
-        assert len(errors) == 0
-        assert len(warnings) == 0
+        assert (errors, warnings) == ([], [])
 
-    def test_simple_function_passes(self):
+    def test_simple_function_passes(self, leading_equals_rule):
         """Test that simple function call is valid."""
         data = {"formula": "SUM(A1:A10)"}
-        errors, warnings = self.rule.check(Path("test.yaml"), data)
+        errors, warnings = leading_equals_rule.check(Path("test.yaml"), data)
 
-        assert len(errors) == 0
-        assert len(warnings) == 0
+        assert (errors, warnings) == ([], [])
 
 
 class TestNoTopLevelLambdaRule:
     """Test the NoTopLevelLambdaRule for detecting uninvoked LAMBDA."""
 
-    def setup_method(self):
-        """Initialize rule before each test."""
-        self.rule = NoTopLevelLambdaRule()
-
-    def test_normal_formula_passes(self):
+    def test_normal_formula_passes(self, top_level_lambda_rule):
         """Test that normal formula without LAMBDA passes."""
         data = {"formula": "LET(x, 1, x)"}
-        errors, warnings = self.rule.check(Path("test.yaml"), data)
+        errors, warnings = top_level_lambda_rule.check(Path("test.yaml"), data)
 
-        assert len(errors) == 0
-        assert len(warnings) == 0
+        assert (errors, warnings) == ([], [])
 
-    def test_uninvoked_lambda_fails(self):
+    def test_uninvoked_lambda_fails(self, top_level_lambda_rule):
         """Test that LAMBDA(x, x+1) without invocation produces error.
 
         Uninvoked LAMBDA is invalid because Google Sheets adds the wrapper
         automatically when you define parameters.
         """
         data = {"formula": "LAMBDA(x, x+1)"}
-        errors, warnings = self.rule.check(Path("test.yaml"), data)
+        errors, warnings = top_level_lambda_rule.check(Path("test.yaml"), data)
 
-        assert len(errors) == 1
-        assert "uninvoked" in errors[0].lower()
-        assert len(warnings) == 0
+        assert_one_error(errors, warnings, "uninvoked")
 
-    def test_self_executing_lambda_warns(self):
+    def test_self_executing_lambda_warns(self, top_level_lambda_rule):
         """Test that self-executing LAMBDA produces warning, not error.
 
         LAMBDA(x, x+1)(0) is technically valid but unnecessary.
         """
         data = {"formula": "LAMBDA(x, x+1)(0)"}
-        errors, warnings = self.rule.check(Path("test.yaml"), data)
+        errors, warnings = top_level_lambda_rule.check(Path("test.yaml"), data)
 
-        assert len(errors) == 0
+        assert not errors
         assert len(warnings) == 1
         assert "self-executing" in warnings[0].lower()
 
-    def test_nested_lambda_inside_let_passes(self):
+    def test_nested_lambda_inside_let_passes(self, top_level_lambda_rule):
         """Test that LAMBDA nested in LET is allowed.
 
         Only top-level uninvoked LAMBDA is invalid. LAMBDA inside LET
         or as argument is fine.
         """
         data = {"formula": "LET(f, LAMBDA(x, x+1), f(5))"}
-        errors, warnings = self.rule.check(Path("test.yaml"), data)
+        errors, warnings = top_level_lambda_rule.check(Path("test.yaml"), data)
 
-        assert len(errors) == 0
-        assert len(warnings) == 0
+        assert (errors, warnings) == ([], [])
 
-    def test_lambda_lowercase_fails(self):
+    def test_lambda_lowercase_fails(self, top_level_lambda_rule):
         """Test that lowercase 'lambda' also fails (case-insensitive check)."""
         data = {"formula": "lambda(x, x+1)"}
-        errors, warnings = self.rule.check(Path("test.yaml"), data)
+        errors, warnings = top_level_lambda_rule.check(Path("test.yaml"), data)
 
-        assert len(errors) == 1
-        assert "uninvoked" in errors[0].lower()
+        assert_one_error(errors, warnings, "uninvoked")
 
-    def test_missing_formula_field_passes(self):
+    def test_missing_formula_field_passes(self, top_level_lambda_rule):
         """Test that missing formula field is skipped."""
         data = {"name": "MYFUNCTION"}
-        errors, warnings = self.rule.check(Path("test.yaml"), data)
+        errors, warnings = top_level_lambda_rule.check(Path("test.yaml"), data)
 
-        assert len(errors) == 0
-        assert len(warnings) == 0
+        assert (errors, warnings) == ([], [])
 
-    def test_non_string_formula_passes(self):
+    def test_non_string_formula_passes(self, top_level_lambda_rule):
         """Test that non-string formula field is skipped."""
         data = {"formula": 123}
-        errors, warnings = self.rule.check(Path("test.yaml"), data)
+        errors, warnings = top_level_lambda_rule.check(Path("test.yaml"), data)
 
-        assert len(errors) == 0
-        assert len(warnings) == 0
+        assert (errors, warnings) == ([], [])
 
-    def test_lambda_as_argument_passes(self):
+    def test_lambda_as_argument_passes(self, top_level_lambda_rule):
         """Test that LAMBDA as an argument (not top-level) is allowed.
 
         BYROW(range, LAMBDA(r, ...)) is valid because the LAMBDA
         is an argument, not the top-level formula.
         """
         data = {"formula": "BYROW(range, LAMBDA(r, COUNTA(r)))"}
-        errors, warnings = self.rule.check(Path("test.yaml"), data)
+        errors, warnings = top_level_lambda_rule.check(Path("test.yaml"), data)
 
-        assert len(errors) == 0
-        assert len(warnings) == 0
+        assert (errors, warnings) == ([], [])
 
-    def test_whitespace_before_lambda_fails(self):
+    def test_whitespace_before_lambda_fails(self, top_level_lambda_rule):
         """Test that leading whitespace is ignored before checking LAMBDA."""
         data = {"formula": "  LAMBDA(x, x+1)"}
-        errors, warnings = self.rule.check(Path("test.yaml"), data)
+        errors, warnings = top_level_lambda_rule.check(Path("test.yaml"), data)
 
-        assert len(errors) == 1
-        assert len(warnings) == 0
+        assert_one_error(errors, warnings, "uninvoked")
 
-    def test_self_executing_lambda_with_multiple_args_warns(self):
+    def test_self_executing_lambda_with_multiple_args_warns(self, top_level_lambda_rule):
         """Test self-executing LAMBDA with multiple arguments warns."""
         data = {"formula": "LAMBDA(x, y, x+y)(1, 2)"}
-        errors, warnings = self.rule.check(Path("test.yaml"), data)
+        errors, warnings = top_level_lambda_rule.check(Path("test.yaml"), data)
 
-        assert len(errors) == 0
+        assert not errors
         assert len(warnings) == 1
 
-    def test_self_executing_lambda_with_whitespace_warns(self):
+    def test_self_executing_lambda_with_whitespace_warns(self, top_level_lambda_rule):
         """Test self-executing LAMBDA with whitespace between definition and call."""
         data = {"formula": "LAMBDA(x, x+1) (5)"}
-        errors, warnings = self.rule.check(Path("test.yaml"), data)
+        errors, warnings = top_level_lambda_rule.check(Path("test.yaml"), data)
 
-        assert len(errors) == 0
+        assert not errors
+        assert len(warnings) == 1
+
+    def test_parentheses_inside_strings_ignored(self, top_level_lambda_rule):
+        """Test that parentheses in string literals don't end the LAMBDA definition early."""
+        data = {"formula": 'LAMBDA(x, CONCATENATE(x, ")("))(0)'}
+        errors, warnings = top_level_lambda_rule.check(Path("test.yaml"), data)
+
+        assert not errors
         assert len(warnings) == 1
 
 
 class TestRequireParameterExamplesRule:
     """Test the RequireParameterExamplesRule for parameter example validation."""
 
-    def setup_method(self):
-        """Initialize rule before each test."""
-        self.rule = RequireParameterExamplesRule()
-
-    def test_parameter_with_non_empty_example_passes(self):
+    def test_parameter_with_non_empty_example_passes(self, parameter_examples_rule):
         """Test that parameter with non-empty example passes."""
         data = {
             "parameters": [{"name": "input", "description": "Test parameter", "example": "A1:B10"}]
         }
-        errors, warnings = self.rule.check(Path("test.yaml"), data)
+        errors, warnings = parameter_examples_rule.check(Path("test.yaml"), data)
 
-        assert len(errors) == 0
-        assert len(warnings) == 0
+        assert (errors, warnings) == ([], [])
 
-    def test_parameter_with_empty_example_fails(self):
+    def test_parameter_with_empty_example_fails(self, parameter_examples_rule):
         """Test that parameter with empty example produces error."""
         data = {
             "parameters": [
                 {"name": "replacement", "description": "Replacement value", "example": ""}
             ]
         }
-        errors, warnings = self.rule.check(Path("test.yaml"), data)
+        errors, warnings = parameter_examples_rule.check(Path("test.yaml"), data)
 
-        assert len(errors) == 1
-        assert "empty example" in errors[0].lower()
-        assert "replacement" in errors[0].lower()
-        assert len(warnings) == 0
+        assert_one_error(errors, warnings, "empty example", "replacement")
 
-    def test_parameter_missing_example_fails(self):
+    def test_parameter_missing_example_fails(self, parameter_examples_rule):
         """Test that parameter without example field produces error."""
         data = {"parameters": [{"name": "input", "description": "Missing example"}]}
-        errors, warnings = self.rule.check(Path("test.yaml"), data)
+        errors, warnings = parameter_examples_rule.check(Path("test.yaml"), data)
 
-        assert len(errors) == 1
-        assert "missing" in errors[0].lower()
-        assert "example" in errors[0].lower()
-        assert "input" in errors[0].lower()
-        assert len(warnings) == 0
+        assert_one_error(errors, warnings, "missing", "example", "input")
 
-    def test_multiple_parameters_all_with_examples_passes(self):
+    def test_multiple_parameters_all_with_examples_passes(self, parameter_examples_rule):
         """Test that multiple parameters with examples pass."""
         data = {
             "parameters": [
@@ -270,12 +302,11 @@ class TestRequireParameterExamplesRule:
                 {"name": "func", "description": "Callback", "example": "LAMBDA(x, SUM(x))"},
             ]
         }
-        errors, warnings = self.rule.check(Path("test.yaml"), data)
+        errors, warnings = parameter_examples_rule.check(Path("test.yaml"), data)
 
-        assert len(errors) == 0
-        assert len(warnings) == 0
+        assert (errors, warnings) == ([], [])
 
-    def test_multiple_parameters_one_empty_fails(self):
+    def test_multiple_parameters_one_empty_fails(self, parameter_examples_rule):
         """Test that multiple parameters with one empty example fails."""
         data = {
             "parameters": [
@@ -284,76 +315,78 @@ class TestRequireParameterExamplesRule:
                 {"name": "func", "description": "Callback", "example": "LAMBDA(x, SUM(x))"},
             ]
         }
-        errors, warnings = self.rule.check(Path("test.yaml"), data)
+        errors, warnings = parameter_examples_rule.check(Path("test.yaml"), data)
 
-        assert len(errors) == 1
-        assert "value" in errors[0].lower()
-        assert "empty example" in errors[0].lower()
+        assert_one_error(errors, warnings, "value", "empty example")
 
-    def test_parameter_with_quoted_example_passes(self):
+    def test_parameter_with_quoted_example_passes(self, parameter_examples_rule):
         """Test that parameter with quoted example passes."""
         data = {"parameters": [{"name": "mode", "description": "Mode", "example": '"rows-any"'}]}
-        errors, warnings = self.rule.check(Path("test.yaml"), data)
+        errors, warnings = parameter_examples_rule.check(Path("test.yaml"), data)
 
-        assert len(errors) == 0
+        assert not errors
 
-    def test_parameter_with_blank_function_example_passes(self):
+    def test_parameter_with_blank_function_example_passes(self, parameter_examples_rule):
         """Test that parameter with BLANK() example passes."""
         data = {"parameters": [{"name": "fill", "description": "Fill value", "example": "BLANK()"}]}
-        errors, warnings = self.rule.check(Path("test.yaml"), data)
+        errors, warnings = parameter_examples_rule.check(Path("test.yaml"), data)
 
-        assert len(errors) == 0
+        assert not errors
 
-    def test_parameter_with_numeric_example_passes(self):
+    def test_parameter_with_numeric_example_passes(self, parameter_examples_rule):
         """Test that parameter with numeric example passes."""
         data = {"parameters": [{"name": "count", "description": "Count", "example": 10}]}
-        errors, warnings = self.rule.check(Path("test.yaml"), data)
+        errors, warnings = parameter_examples_rule.check(Path("test.yaml"), data)
 
-        assert len(errors) == 0
+        assert not errors
 
-    def test_parameter_with_zero_example_passes(self):
+    def test_parameter_with_zero_example_passes(self, parameter_examples_rule):
         """Test that parameter with zero example passes (falsy but valid)."""
         data = {"parameters": [{"name": "offset", "description": "Offset", "example": 0}]}
-        errors, warnings = self.rule.check(Path("test.yaml"), data)
+        errors, warnings = parameter_examples_rule.check(Path("test.yaml"), data)
 
-        assert len(errors) == 0
+        assert not errors
 
-    def test_missing_parameters_field_passes(self):
+    def test_parameter_with_null_example_is_not_missing(self, parameter_examples_rule):
+        """Test that an explicit null example counts as present, not missing."""
+        data = {"parameters": [{"name": "fill", "description": "Fill value", "example": None}]}
+        errors, warnings = parameter_examples_rule.check(Path("test.yaml"), data)
+
+        assert not errors
+
+    def test_missing_parameters_field_passes(self, parameter_examples_rule):
         """Test that missing parameters field is skipped."""
         data = {"name": "TEST_FUNC", "formula": "SUM(A1:A10)"}
-        errors, warnings = self.rule.check(Path("test.yaml"), data)
+        errors, warnings = parameter_examples_rule.check(Path("test.yaml"), data)
 
-        assert len(errors) == 0
-        assert len(warnings) == 0
+        assert (errors, warnings) == ([], [])
 
-    def test_non_list_parameters_field_passes(self):
+    def test_non_list_parameters_field_passes(self, parameter_examples_rule):
         """Test that non-list parameters field is skipped."""
         data = {"parameters": "not a list"}
-        errors, warnings = self.rule.check(Path("test.yaml"), data)
+        errors, warnings = parameter_examples_rule.check(Path("test.yaml"), data)
 
-        assert len(errors) == 0
-        assert len(warnings) == 0
+        assert (errors, warnings) == ([], [])
 
-    def test_parameter_with_quoted_empty_string_example_fails(self):
+    def test_parameter_with_quoted_empty_string_example_fails(self, parameter_examples_rule):
         """Test that parameter with '""' as example fails (literal empty string)."""
         data = {"parameters": [{"name": "replacement", "description": "Value", "example": ""}]}
-        errors, warnings = self.rule.check(Path("test.yaml"), data)
+        errors, warnings = parameter_examples_rule.check(Path("test.yaml"), data)
 
-        assert len(errors) == 1
-        assert "empty example" in errors[0].lower()
+        assert_one_error(errors, warnings, "empty example")
 
-    def test_parameter_with_double_quoted_example_passes(self):
+    def test_parameter_with_double_quoted_example_passes(self, parameter_examples_rule):
         """Test that parameter with double-quoted string example passes.
 
         When the YAML value is '"text"', it represents the string with quotes,
         which is a non-empty string, so it should pass.
         """
         data = {"parameters": [{"name": "text", "description": "Text", "example": '""'}]}
-        errors, warnings = self.rule.check(Path("test.yaml"), data)
+        errors, warnings = parameter_examples_rule.check(Path("test.yaml"), data)
 
-        assert len(errors) == 0
+        assert not errors
 
-    def test_non_dict_parameter_element_skipped(self):
+    def test_non_dict_parameter_element_skipped(self, parameter_examples_rule):
         """Test that non-dict parameter elements are skipped."""
         data = {
             "parameters": [
@@ -362,206 +395,233 @@ class TestRequireParameterExamplesRule:
                 {"name": "param2", "description": "Also valid", "example": "B1"},
             ]
         }
-        errors, warnings = self.rule.check(Path("test.yaml"), data)
+        errors, warnings = parameter_examples_rule.check(Path("test.yaml"), data)
 
         # Should check the valid parameters but skip the string element
-        assert len(errors) == 0
+        assert not errors
 
-    def test_error_includes_file_path(self):
+    def test_error_includes_file_path(self, parameter_examples_rule):
         """Test that error message includes the file path."""
         data = {"parameters": [{"name": "test", "description": "Test", "example": ""}]}
-        errors, warnings = self.rule.check(Path("formulas/test.yaml"), data)
+        errors, warnings = parameter_examples_rule.check(Path("formulas/test.yaml"), data)
 
-        assert len(errors) == 1
-        assert "formulas/test.yaml" in errors[0]
+        assert_one_error(errors, warnings, "formulas/test.yaml")
 
 
 class TestFormulaLinter:
     """Test the main FormulaLinter class."""
 
-    def setup_method(self):
-        """Initialize linter before each test."""
-        self.linter = FormulaLinter()
-
-    def test_linter_has_expected_rules(self):
+    def test_linter_has_expected_rules(self, linter):
         """Test that linter has all expected rules registered."""
-        rule_names = {rule.name for rule in self.linter.rules}
+        rule_names = {rule.name for rule in linter.rules}
 
         assert "no-leading-equals" in rule_names
         assert "no-top-level-lambda" in rule_names
         assert "require-parameter-examples" in rule_names
         assert "valid-formula-syntax" in rule_names
-        assert len(self.linter.rules) == 4
+        assert len(linter.rules) == 4
 
-    def test_lint_file_with_valid_yaml(self):
+    def test_lint_file_with_valid_yaml(self, linter, tmp_path):
         """Test linting a valid YAML file with no linter errors."""
-        # Create a temporary YAML file with valid formula
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump({"name": "TEST_FUNC", "formula": "LET(x, 1, x)"}, f)
-            temp_path = Path(f.name)
-
-        try:
-            errors, warnings = self.linter.lint_file(temp_path)
-            assert len(errors) == 0
-            assert len(warnings) == 0
-        finally:
-            temp_path.unlink()
-
-    def test_lint_file_with_leading_equals_error(self):
-        """Test linting file with leading = produces error."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump({"name": "TEST_FUNC", "formula": "=SUM(A1:A10)"}, f)
-            temp_path = Path(f.name)
-
-        try:
-            errors, warnings = self.linter.lint_file(temp_path)
-            assert len(errors) == 1
-            assert "starts with" in errors[0].lower()
-        finally:
-            temp_path.unlink()
-
-    def test_lint_file_with_uninvoked_lambda_error(self):
-        """Test linting file with uninvoked LAMBDA produces error."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump({"name": "TEST_FUNC", "formula": "LAMBDA(x, x+1)"}, f)
-            temp_path = Path(f.name)
-
-        try:
-            errors, warnings = self.linter.lint_file(temp_path)
-            assert len(errors) == 1
-            assert "uninvoked" in errors[0].lower()
-        finally:
-            temp_path.unlink()
-
-    def test_lint_file_with_self_executing_lambda_warning(self):
-        """Test linting file with self-executing LAMBDA produces error and warning.
+        yaml_path = tmp_path / "test_func.yaml"
+        yaml_path.write_text(yaml.safe_dump({"name": "TEST_FUNC", "formula": "LET(x, 1, x)"}))
+
+        errors, warnings = linter.lint_file(yaml_path)
+        assert (errors, warnings) == ([], [])
+
+    def test_lint_content_with_leading_equals_error(self, linter):
+        """Test linting content with leading = produces error."""
+        text = "name: TEST_FUNC\nformula: '=SUM(A1:A10)'\n"
+        errors, warnings = linter.lint_content(Path("test.yaml"), text)
+
+        assert_one_error(errors, warnings, "starts with")
+
+    def test_lint_content_with_uninvoked_lambda_error(self, linter):
+        """Test linting content with uninvoked LAMBDA produces error."""
+        text = "name: TEST_FUNC\nformula: LAMBDA(x, x+1)\n"
+        errors, warnings = linter.lint_content(Path("test.yaml"), text)
+
+        assert_one_error(errors, warnings, "uninvoked")
+
+    def test_lint_content_with_self_executing_lambda_warning(self, linter):
+        """Test linting content with self-executing LAMBDA produces error and warning.
 
         Self-executing LAMBDAs produce:
         - 1 error from ValidFormulaSyntaxRule (invalid syntax per pyparsing grammar)
         - 1 warning from NoTopLevelLambdaRule (unnecessary self-executing pattern)
         """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump({"name": "TEST_FUNC", "formula": "LAMBDA(x, x+1)(0)"}, f)
-            temp_path = Path(f.name)
-
-        try:
-            errors, warnings = self.linter.lint_file(temp_path)
-            assert len(errors) == 1
-            assert "syntax" in errors[0].lower()
-            assert len(warnings) == 1
-            assert "self-executing" in warnings[0].lower()
-        finally:
-            temp_path.unlink()
-
-    def test_lint_file_with_yaml_parse_error(self):
-        """Test linting file with invalid YAML produces error."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            # Write invalid YAML
-            f.write("invalid: yaml: content: without: proper: structure")
-            temp_path = Path(f.name)
-
-        try:
-            errors, warnings = self.linter.lint_file(temp_path)
-            assert len(errors) == 1
-            assert "parsing error" in errors[0].lower() or "yaml" in errors[0].lower()
-        finally:
-            temp_path.unlink()
-
-    def test_lint_file_with_non_dict_yaml(self):
-        """Test linting file where YAML parses to non-dict raises error."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            # Write YAML that parses as a list, not a dict
-            f.write("- item1\n- item2\n")
-            temp_path = Path(f.name)
-
-        try:
-            errors, warnings = self.linter.lint_file(temp_path)
-            assert len(errors) == 1
-            assert "invalid yaml structure" in errors[0].lower()
-        finally:
-            temp_path.unlink()
-
-    def test_lint_all_returns_file_count(self):
-        """Test that lint_all returns correct file count."""
-        # Create temporary directory with formula files
-        import tempfile
+        text = "name: TEST_FUNC\nformula: LAMBDA(x, x+1)(0)\n"
+        errors, warnings = linter.lint_content(Path("test.yaml"), text)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir_path = Path(tmpdir)
+        assert_one_error(errors, warnings, "syntax", warning_token="self-executing")
 
-            # Create 3 valid formula files
-            for i in range(3):
-                with open(tmpdir_path / f"formula{i}.yaml", "w") as f:
-                    yaml.dump({"name": f"FUNC{i}", "formula": "LET(x, 1, x)"}, f)
+    def test_lint_content_with_yaml_parse_error(self, linter):
+        """Test linting invalid YAML produces error."""
+        text = "invalid: yaml: content: without: proper: structure"
+        errors, warnings = linter.lint_content(Path("test.yaml"), text)
 
-            files_checked, error_count, warning_count, errors, warnings = self.linter.lint_all(
-                tmpdir_path
-            )
+        assert_one_error(errors, warnings, "yaml parsing error")
 
-            assert files_checked == 3
-            assert error_count == 0
-            assert warning_count == 0
+    def test_lint_content_with_non_dict_yaml(self, linter):
+        """Test linting YAML that parses to non-dict raises error."""
+        # YAML that parses as a list, not a dict
+        text = "- item1\n- item2\n"
+        errors, warnings = linter.lint_content(Path("test.yaml"), text)
 
-    def test_lint_all_counts_errors(self):
-        """Test that lint_all correctly counts errors from multiple files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir_path = Path(tmpdir)
+        assert_one_error(errors, warnings, "invalid yaml structure")
 
-            # Create one valid and one invalid file
-            with open(tmpdir_path / "valid.yaml", "w") as f:
-                yaml.dump({"name": "VALID", "formula": "LET(x, 1, x)"}, f)
+    def test_lint_content_with_empty_mapping(self, linter):
+        """Test that an empty mapping is valid structure and triggers no rules."""
+        errors, warnings = linter.lint_content(Path("test.yaml"), "{}\n")
 
-            with open(tmpdir_path / "invalid.yaml", "w") as f:
-                yaml.dump({"name": "INVALID", "formula": "=SUM(A1:A10)"}, f)
+        assert (errors, warnings) == ([], [])
 
-            files_checked, error_count, warning_count, errors, warnings = self.linter.lint_all(
-                tmpdir_path
-            )
+    def test_lint_file_with_missing_file(self, linter):
+        """Test linting a path that cannot be read reports an error instead of raising."""
+        errors, warnings = linter.lint_file(Path("does-not-exist.yaml"))
 
-            assert files_checked == 2
-            assert error_count == 1
-            assert len(errors) == 1
+        assert_one_error(errors, warnings, "does-not-exist.yaml")
 
-    def test_lint_all_counts_warnings(self):
+    def test_lint_all_returns_file_count(self, linter, formula_corpus):
+        """Test that lint_all returns correct file count."""
+        files_checked, error_count, warning_count, errors, warnings = linter.lint_all(
+            formula_corpus / "valid_only"
+        )
+
+        assert files_checked == 3
+        assert error_count == 0
+        assert warning_count == 0
+
+    def test_lint_all_counts_errors(self, linter, formula_corpus):
+        """Test that lint_all correctly counts errors from multiple files."""
+        files_checked, error_count, warning_count, errors, warnings = linter.lint_all(
+            formula_corpus / "with_error"
+        )
+
+        assert files_checked == 2
+        assert error_count == 1
+        assert_one_error(errors, warnings, "starts with")
+
+    def test_lint_all_counts_warnings(self, linter, formula_corpus):
         """Test that lint_all correctly counts warnings from multiple files.
 
         Self-executing LAMBDAs produce both an error (syntax) and a warning (pattern).
         """
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir_path = Path(tmpdir)
+        files_checked, error_count, warning_count, errors, warnings = linter.lint_all(
+            formula_corpus / "with_warning"
+        )
 
-            # Create file with warning (self-executing LAMBDA)
-            with open(tmpdir_path / "warning.yaml", "w") as f:
-                yaml.dump({"name": "WARNING_FUNC", "formula": "LAMBDA(x, x+1)(0)"}, f)
+        assert files_checked == 1
+        assert error_count == 1  # From ValidFormulaSyntaxRule
+        assert warning_count == 1  # From NoTopLevelLambdaRule
+        assert_one_error(errors, warnings, "syntax", warning_token="self-executing")
 
-            files_checked, error_count, warning_count, errors, warnings = self.linter.lint_all(
-                tmpdir_path
-            )
+    def test_lint_all_with_empty_directory(self, linter, formula_corpus):
+        """Test lint_all on directory with no YAML files."""
+        files_checked, error_count, warning_count, errors, warnings = linter.lint_all(
+            formula_corpus / "empty"
+        )
 
-            assert files_checked == 1
-            assert error_count == 1  # From ValidFormulaSyntaxRule
-            assert warning_count == 1  # From NoTopLevelLambdaRule
-            assert len(errors) == 1
-            assert len(warnings) == 1
+        assert files_checked == 0
+        assert error_count == 0
+        assert warning_count == 0
 
-    def test_lint_all_with_empty_directory(self):
-        """Test lint_all on directory with no YAML files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir_path = Path(tmpdir)
+    def test_lint_all_only_checks_yaml_files(self, linter, tmp_path):
+        """Test that lint_all lints top-level .yaml files in name order and skips everything else."""
+        (tmp_path / "b.yaml").write_text("name: B\nformula: '=B1'\n")
+        (tmp_path / "a.yaml").write_text("name: A\nformula: '=A1'\n")
+        (tmp_path / "notes.txt").write_text("formula: '=C1'\n")
+        (tmp_path / "nested.yaml").mkdir()
+        (tmp_path / "nested.yaml" / "d.yaml").write_text("name: D\nformula: '=D1'\n")
+
+        files_checked, error_count, warning_count, errors, warnings = linter.lint_all(tmp_path)
+
+        assert files_checked == 2
+        assert [Path(error.split(":")[0]).name for error in errors] == ["a.yaml", "b.yaml"]
+
+    def test_rules_skipped_when_required_keys_missing(self):
+        """Test that the linter only runs a rule on documents that have its REQUIRED_KEYS."""
 
-            files_checked, error_count, warning_count, errors, warnings = self.linter.lint_all(
-                tmpdir_path
-            )
+        class RecordingRule(LintRule):
+            REQUIRED_KEYS = frozenset({"parameters"})
 
-            assert files_checked == 0
-            assert error_count == 0
-            assert warning_count == 0
+            def __init__(self):
+                super().__init__(name="recording", description="Records checked files")
+                self.checked = []
+
+            def check(self, file_path, data):
+                self.checked.append(file_path)
+                return [], []
+
+        rule = RecordingRule()
+        linter = FormulaLinter()
+        linter.rules = [rule]
+
+        linter.lint_content(Path("no_params.yaml"), "name: FUNC\nformula: LET(x, 1, x)\n")
+        linter.lint_content(Path("params.yaml"), "name: FUNC\nparameters: []\n")
+
+        assert rule.checked == [Path("params.yaml")]
+
+    def test_rule_list_changes_take_effect(self):
+        """Test that reassigning or extending rules after linting is honored."""
+        linter = FormulaLinter()
+        text = "name: FUNC\nformula: '=A1'\n"
+        assert len(linter.lint_content(Path("test.yaml"), text)[0]) == 1
+
+        linter.rules = [NoTopLevelLambdaRule()]
+        assert linter.lint_content(Path("test.yaml"), text) == ([], [])
+
+        linter.rules.append(NoLeadingEqualsRule())
+        assert len(linter.lint_content(Path("test.yaml"), text)[0]) == 1
+
+    @pytest.mark.parametrize("loader", ["default", "pure_python"])
+    def test_lint_stream_matches_lint_file(self, linter, tmp_path, monkeypatch, loader):
+        """Test that linting a joined YAML stream reports the same as per-file linting."""
+        if loader == "pure_python":
+            # The fallback used when libyaml is unavailable
+            monkeypatch.setattr(lint_formulas, "SafeLoader", yaml.SafeLoader)
+
+        contents = {
+            "valid.yaml": b"name: VALID\nformula: LET(x, 1, x)\n",
+            "equals.yaml": b"name: EQUALS\nformula: '=SUM(A1:A10)'\n",
+            "empty.yaml": b"",
+            "list.yaml": b"- item1\n- item2",
+            "bom.yaml": b"\xef\xbb\xbfformula: '=A1'\nname: BOM\n",
+        }
+        paths = []
+        for name, content in contents.items():
+            path = tmp_path / name
+            path.write_bytes(content)
+            paths.append(path)
+
+        expected = [linter.lint_file(path) for path in paths]
+        files_checked, error_count, warning_count, errors, warnings = linter.lint_stream(paths)
+
+        assert files_checked == len(paths)
+        assert errors == [error for file_errors, _ in expected for error in file_errors]
+        assert warnings == [warning for _, file_warnings in expected for warning in file_warnings]
+        assert error_count == 4
+
+    def test_lint_stream_falls_back_for_document_markers(self, linter, tmp_path):
+        """Test that files with their own YAML document markers are still linted one by one."""
+        marked = tmp_path / "marked.yaml"
+        marked.write_text("---\nname: MARKED\nformula: '=SUM(A1:A10)'\n")
+        valid = tmp_path / "valid.yaml"
+        valid.write_text("name: VALID\nformula: LET(x, 1, x)\n")
+
+        files_checked, error_count, warning_count, errors, warnings = linter.lint_stream(
+            [marked, valid]
+        )
+
+        assert files_checked == 2
+        assert error_count == 1
+        assert_one_error(errors, warnings, str(marked))
 
 
 class TestExistingFormulas:
     """Regression test: All existing formulas in the repository must pass linting."""
 
-    def test_all_existing_formulas_pass_lint(self):
+    def test_all_existing_formulas_pass_lint(self, linter):
         """Test that all formulas in formulas/ directory pass linting."""
         # Find the formulas directory relative to the project root
         project_root = Path(__file__).parent.parent
@@ -571,7 +631,6 @@ class TestExistingFormulas:
         if not formulas_dir.exists():
             pytest.skip("formulas/ directory not found")
 
-        linter = FormulaLinter()
         files_checked, error_count, warning_count, errors, warnings = linter.lint_all(formulas_dir)
 
         # All errors should be reported in assertion message for debugging